@@ -9,9 +9,67 @@ You should subclass :class:`ConfigSerDeBase` and override the following static f
 - ``deserialize``: Take a string representation of the value and return a Python structure.
 '''
 
-from typing import Any, List, Sequence, Mapping
+import re
+from typing import Any, ClassVar, Dict, List, Optional, Pattern, Sequence, Mapping, Union
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+# A run of 19 or more digits may exceed the int64 range
+_LONG_DIGIT_RUN = re.compile(r'\d{19}')
+
+# True if this module was AOT-compiled (for example with mypyc, see setup.py):
+# in that case the parse loops below already run as C code and the numba JIT
+# (which needs Python bytecode to compile) is not used.
+_AOT_COMPILED : bool = not __file__.endswith('.py')
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None and not _AOT_COMPILED:
+    @numba.njit(cache=True)
+    def _parse_int_list(buf: bytes, sep_byte: int, n_items: int) -> np.ndarray:
+        ''' Parses a separated list of integers from an ASCII byte buffer.
+
+        Scans the buffer byte-by-byte in a single pass, filling a preallocated
+        int64 array. Raises ValueError if the buffer is not strictly a list of
+        integers separated by ``sep_byte``: callers should fall back to the
+        slower Python parser that raises the appropriate error.
+        '''
+        out: np.ndarray = np.empty(n_items, dtype=np.int64)
+        idx, i, n = 0, 0, len(buf)
+        while True:
+            while i < n and (buf[i] == 32 or buf[i] == 9):
+                i += 1
+            sign = 1
+            if i < n and (buf[i] == 43 or buf[i] == 45):
+                if buf[i] == 45:
+                    sign = -1
+                i += 1
+            acc, ndigits = 0, 0
+            while i < n and 48 <= buf[i] <= 57:
+                acc = acc * 10 + (buf[i] - 48)
+                ndigits += 1
+                i += 1
+            if ndigits == 0 or ndigits > 18:
+                raise ValueError('invalid integer list')
+            while i < n and (buf[i] == 32 or buf[i] == 9):
+                i += 1
+            out[idx] = acc * sign
+            idx += 1
+            if i == n:
+                break
+            if buf[i] != sep_byte or idx == n_items:
+                raise ValueError('invalid integer list')
+            i += 1
+        if idx != n_items:
+            raise ValueError('invalid integer list')
+        return out
+else:
+    _parse_int_list = None
+
 class ConfigSerDeBase(ABC):
     ''' Defines a serializer / deserializer interface. '''
 
@@ -57,24 +115,68 @@ class IntegerListSerDe(ConfigSerDeBase):
     example: str = '0, 1, 2'
 
     @staticmethod
-    def serialize(value: Sequence[int], metadata: Mapping[str, Any]={}) -> str:
+    def serialize(
+        value: Union[Sequence[int], np.ndarray], metadata: Mapping[str, Any]={}
+    ) -> str:
         ''' Serializes a list of integers into a string.
 
         Args:
-            value (Sequence[int]): The list of integers.
+            value (Union[Sequence[int], np.ndarray]): The list of integers, either as a
+                Python sequence or as a numpy array.
 
         Returns:
             The list of integers serialized into a string.
         '''
         sep = metadata.get('separator', ', ')
+        if isinstance(value, np.ndarray):
+            # str() of a numpy scalar is much slower than str() of a Python int
+            value = value.tolist()
         return sep.join(str(e) for e in value)
 
+    _valid_patterns : ClassVar[Dict[str, Pattern]] = {}
+    ''' Cached per-separator regexes validating the input of the numpy parser. '''
+
+    @staticmethod
+    def _parse_numpy(value: str, sep: str) -> Optional[np.ndarray]:
+        ''' Parses a separated list of integers with numpy in a single C-level pass.
+
+        Returns None if the string is not strictly a ``sep``-separated list of integers:
+        in this case callers should fall back to the slower Python parser that raises
+        the appropriate error.
+        '''
+        pattern = IntegerListSerDe._valid_patterns.get(sep)
+        if pattern is None:
+            # One optionally signed integer per separator, nothing else. np.fromstring
+            # must not see anything weaker: it converts empty or sign-only tokens to 0
+            # instead of raising.
+            token = r'\s*[+-]?\d+\s*'
+            pattern = re.compile(token + '(?:' + re.escape(sep) + token + ')*')
+            IntegerListSerDe._valid_patterns[sep] = pattern
+        if pattern.fullmatch(value) is None:
+            return None
+        if _LONG_DIGIT_RUN.search(value) is not None:
+            # np.fromstring silently saturates integers that do not fit in int64; numbers
+            # with 19+ digits must be parsed by the exact Python parser
+            return None
+        try:
+            arr = np.fromstring(value, sep=sep, dtype=np.int64)
+        except ValueError:
+            # Defensive: the validation above should make this unreachable
+            return None
+        return arr if arr.size == value.count(sep) + 1 else None
+
     @staticmethod
-    def deserialize(value: str, metadata: Mapping[str, Any]={}) -> List[int]:
+    def deserialize(
+        value: str, metadata: Mapping[str, Any]={}
+    ) -> Union[List[int], np.ndarray]:
         '''Restores a list of integers from a string.
 
         Args:
             value (str): A string containing a serialized list of integers.
+            metadata (Mapping[str, Any]): If ``metadata['as_ndarray']`` is truthy, the values
+                are returned in a :class:`numpy.ndarray` of ``numpy.int64`` instead of a
+                Python list, so downstream vectorized code can consume them without a
+                conversion round-trip.
 
         Returns:
             The list of integers restored from the string.
@@ -83,4 +185,34 @@ class IntegerListSerDe(ConfigSerDeBase):
             Exception: exceptions related to invalid string format.
         '''
         sep = metadata.get('separator', ',')
-        return [int(e) for e in value.split(sep)]
+        arr = None
+        if len(sep) == 1:
+            if _parse_int_list is not None and ord(sep) < 128:
+                try:
+                    arr = _parse_int_list(value.encode('utf-8'), ord(sep), value.count(sep) + 1)
+                except ValueError:
+                    arr = None
+            else:
+                arr = IntegerListSerDe._parse_numpy(value, sep)
+        if arr is None:
+            values = [int(e) for e in value.split(sep)]
+            if metadata.get('as_ndarray'):
+                return np.asarray(values, dtype=np.int64)
+            return values
+        return arr if metadata.get('as_ndarray') else arr.tolist()
+
+    @staticmethod
+    def jit_enabled() -> bool:
+        ''' Returns True if the numba JIT-compiled parser is available. '''
+        return _parse_int_list is not None
+
+    @staticmethod
+    def warm_up() -> None:
+        ''' Triggers the JIT compilation of the numba parser, if numba is available.
+
+        The first call of the JIT-compiled parser pays the compilation cost, which can take
+        seconds. Call this method at application startup to hide this latency from the
+        first real :meth:`deserialize` call.
+        '''
+        if _parse_int_list is not None:
+            IntegerListSerDe.deserialize('0, 1')
@@ -128,6 +128,7 @@ class Point(metaclass=PointMeta):
         Supported formats:
 
          - sequence containing exactly two numbers
+         - numpy array of shape (2,)
          - dictionary containing numbers under 'x' and 'y' keys
          - Point instance (returns the same instance)
 
@@ -138,6 +139,19 @@ class Point(metaclass=PointMeta):
 
         Raises: ValueError if the conversion was not successful.
         '''
+        # Exact-type fast paths: annotation drivers convert points once per annotation
+        # per frame, and the generic isinstance checks below (the Point check goes
+        # through PointMeta.__instancecheck__) are comparatively expensive.
+        vtype = type(value)
+        if vtype is Point:
+            return value
+        if (
+            (vtype is tuple or vtype is list) and
+            len(value) == 2 and
+            isinstance(value[0], Number) and
+            isinstance(value[1], Number)
+        ):
+            return cls(x=value[0], y=value[1])
         if isinstance(value, Point):
             return value
         elif isinstance(value, collections.abc.Mapping) and 'x' in value and 'y' in value:
@@ -149,6 +163,9 @@ class Point(metaclass=PointMeta):
             isinstance(value[1], Number)
         ):
             return cls(x=value[0], y=value[1])
+        elif isinstance(value, np.ndarray) and value.shape == (2,):
+            scalars = value.tolist()
+            return cls(x=scalars[0], y=scalars[1])
         else:
             raise ValueError(f'Could not convert {value} to Point.')
 
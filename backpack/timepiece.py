@@ -3,6 +3,7 @@ and scheduling tasks in an external event loop. '''
 
 import time
 import datetime
+import math
 import threading
 from collections import deque
 from itertools import islice
@@ -12,6 +13,12 @@ import concurrent.futures
 
 from dateutil.tz import tzlocal
 
+try:
+    from statistics import fmean as _fmean
+except ImportError: # Python 3.7
+    def _fmean(data):
+        return sum(data) / len(data)
+
 def local_now() -> datetime.datetime:
     ''' Returns the current time in local time zone.
 
@@ -55,24 +62,53 @@ class BaseTimer(ABC):
     # Print at most this many intervals in __repr__
     MAX_REPR_INTERVALS = 5
 
+    __slots__ = ('intervals', '_min', '_max')
+
     def __init__(self, max_intervals:int=10):
         self.intervals: Deque[float] = deque(maxlen=max_intervals)
+        self._min: float = math.inf
+        self._max: float = -math.inf
+
+    def _push(self, interval: float) -> None:
+        ''' Records a new interval, keeping the cached extrema up-to-date.
+
+        Subclasses should always record intervals with this method instead of appending
+        to `intervals` directly.
+        '''
+        intervals = self.intervals
+        if len(intervals) == intervals.maxlen:
+            if not intervals.maxlen:
+                # appending to a zero-length window silently discards the interval
+                return
+            evicted = intervals[0]
+            intervals.append(interval)
+            if evicted == self._min or evicted == self._max:
+                # The evicted interval was an extremum: rescan the window
+                self._min = min(intervals)
+                self._max = max(intervals)
+                return
+        else:
+            intervals.append(interval)
+        if interval < self._min:
+            self._min = interval
+        if interval > self._max:
+            self._max = interval
 
     def min(self) -> float:
         ''' Returns the shortest time interval between the events (in seconds). '''
-        return min(self.intervals) if len(self.intervals) > 0 else 0.0
+        return self._min if self.intervals else 0.0
 
     def max(self) -> float:
         ''' Returns the longest time interval between the events (in seconds). '''
-        return max(self.intervals) if len(self.intervals) > 0 else 0.0
+        return self._max if self.intervals else 0.0
 
     def mean(self) -> float:
         ''' Returns the mean time interval between the events (in seconds). '''
-        return self.sum() / self.len() if self.len() > 0 else 0.0
+        return _fmean(self.intervals) if self.intervals else 0.0
 
     def sum(self) -> float:
         ''' Returns the sum of the time interval between recorded events (in seconds). '''
-        return sum(self.intervals) if len(self.intervals) > 0 else 0.0
+        return sum(self.intervals) if self.intervals else 0.0
 
     def len(self) -> int:
         ''' Returns the number of recorded events. '''
@@ -86,16 +122,18 @@ class BaseTimer(ABC):
     def reset(self) -> None:
         ''' Resets the timer. '''
         self.intervals.clear()
+        self._min = math.inf
+        self._max = -math.inf
 
     def _repr_props(self) -> Iterator[str]:
         if self.intervals:
-            iv_list = [f'{iv:.4f}' for iv in islice(self.intervals, self.MAX_REPR_INTERVALS)]
+            # map with a bound format method formats the intervals in a single C-level
+            # loop, without reparsing an f-string for each interval
+            iv_list = list(map('{:.4f}'.format, islice(self.intervals, self.MAX_REPR_INTERVALS)))
             if len(self.intervals) > self.MAX_REPR_INTERVALS:
                 iv_list.append('...')
             yield f'intervals=[{", ".join(iv_list)}]'
-            yield f'min={self.min():.4f}'
-            yield f'mean={self.mean():.4f}'
-            yield f'max={self.max():.4f}'
+            yield 'min={:.4f} mean={:.4f} max={:.4f}'.format(self.min(), self.mean(), self.max())
 
     def __repr__(self) -> str:
         elems = [self.__class__.__name__] + list(self._repr_props())
@@ -126,15 +164,48 @@ class Ticker(BaseTimer):
     :ivar intervals: The recorded intervals in seconds between the successive events.
     '''
 
+    # Dict-form __slots__ so that the tick slot carries user-visible documentation
+    # (it holds a bound method instead of being a regular method, see __init__)
+    __slots__ = {
+        '_last_tick': None,
+        '_perf': None,
+        'tick': (
+            'Registers a tick in this Ticker.\n\n'
+            'The first call records the time of the tick; every subsequent call also '
+            'records the interval elapsed since the previous tick.'
+        ),
+    }
+
     def __init__(self, max_intervals:int=10):
         super().__init__(max_intervals=max_intervals)
         self._last_tick: Optional[float] = None
-
-    def tick(self) -> None:
-        ''' Registers a tick in this Ticker. '''
-        now = time.perf_counter()
-        if self._last_tick is not None:
-            self.intervals.append(now - self._last_tick)
+        # Bound at instance level on first use to skip the time.perf_counter
+        # attribute lookup in the hot tick() path. The lazy binding keeps
+        # patches of backpack.timepiece.time working even if they are applied
+        # after this Ticker was constructed.
+        self._perf: Optional[Callable[[], float]] = None
+        # The first tick only records the current time; every later tick also
+        # records an interval. Instead of checking for the first call in every
+        # tick, the tick slot is rebound to the branch-free fast version once
+        # the first call happened.
+        self.tick: Callable[[], None] = self._first_tick
+
+    def _first_tick(self) -> None:
+        ''' Registers a tick in this Ticker.
+
+        Call this method through the `tick` attribute: the first call records the
+        current time and rebinds `tick` to :meth:`_next_tick`.
+        '''
+        perf = self._perf
+        if perf is None:
+            perf = self._perf = time.perf_counter
+        self._last_tick = perf()
+        self.tick = self._next_tick
+
+    def _next_tick(self) -> None:
+        ''' Registers a tick in this Ticker, recording the interval since the last tick. '''
+        now = self._perf()
+        self._push(now - self._last_tick)
         self._last_tick = now
 
 
@@ -198,12 +269,21 @@ class StopWatch(BaseTimer):
         children (Dict[str, 'StopWatch']): The name-indexed dictionary of the children StopWatches
     '''
 
+    __slots__ = (
+        'name', 'parent', 'children', '_start', '_level', '_full_name', '_children_tuple',
+        '_perf'
+    )
+
     def __init__(self, name:str, max_intervals:int=10):
         super().__init__(max_intervals=max_intervals)
         self.name: str = name
         self.parent: Optional['StopWatch'] = None
         self.children: Dict[str, 'StopWatch'] = {}
         self._start: Optional[float] = None
+        self._level: int = 0
+        self._full_name: Optional[str] = None
+        self._children_tuple: Optional[Tuple['StopWatch', ...]] = None
+        self._perf: Optional[Callable[[], float]] = None
 
     def child(self, name:str, max_intervals:Optional[int]=None) -> 'StopWatch':
         ''' Creates a new or returns an existing child of this StopWatch.
@@ -219,7 +299,9 @@ class StopWatch(BaseTimer):
             max_intervals = self.intervals.maxlen
         child = StopWatch(name, max_intervals=max_intervals)
         child.parent = self
+        child._level = self._level + 1
         self.children[name] = child
+        self._children_tuple = None
         return child
 
     def parents(self) -> Iterator['StopWatch']:
@@ -234,24 +316,32 @@ class StopWatch(BaseTimer):
     def full_name(self) -> str:
         ''' Returns the fully qualified name of this StopWatch, including
         all parents' name. '''
-        family = [self.name]
-        family.extend(p.name for p in self.parents())
-        return '.'.join(reversed(family))
+        if self._full_name is None:
+            family: Deque[str] = deque((self.name,))
+            current = self.parent
+            while current is not None:
+                family.appendleft(current.name)
+                current = current.parent
+            self._full_name = '.'.join(family)
+        return self._full_name
 
     def __enter__(self) -> 'StopWatch':
         ''' Context manager entry point returning self.'''
-        self._start = time.perf_counter()
+        perf = self._perf
+        if perf is None:
+            perf = self._perf = time.perf_counter
+        self._start = perf()
         return self
 
     def __exit__(self, *_) -> None:
         ''' Context manager exit. '''
-        self.intervals.append(time.perf_counter() - self._start)
+        self._push(self._perf() - self._start)
         self._start = None
 
     @property
     def level(self) -> int:
         ''' Returns the number of parents. '''
-        return len(list(self.parents()))
+        return self._level
 
     def _repr_props(self) -> Iterator[str]:
         yield f'name={self.name}'
@@ -265,7 +355,9 @@ class StopWatch(BaseTimer):
         newline = '\n'
         props = list(self._repr_props())
         if self.children:
-            children = (repr(c) for c in self.children.values())
+            if self._children_tuple is None:
+                self._children_tuple = tuple(self.children.values())
+            children = (repr(c) for c in self._children_tuple)
             props.append(f'children=[{", ".join(children)}\n{indent}]')
         return f'{newline if lvl > 0 else ""}{indent}<{self.__class__.__name__} {" ".join(props)}>'
 
@@ -535,8 +627,8 @@ class Tachometer:
 
     def _calculate_stats(self):
         timestamp = local_now()
-        if len(self.ticker.intervals) == 0:
+        if not self.ticker.intervals:
             return (False, None)
         res = self.stats_callback(timestamp, self.ticker)
-        self.ticker.intervals.clear()
+        self.ticker.reset()
         return (True, res)
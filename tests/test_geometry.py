@@ -50,9 +50,16 @@ class TestPoint(unittest.TestCase):
             self.assertEqual(pt1, Point.from_value({'x': 4, 'y': 7}))
         with self.subTest('sequence'):
             self.assertEqual(pt1, Point.from_value([4, 7]))
+        with self.subTest('tuple'):
+            self.assertEqual(pt1, Point.from_value((4, 7)))
+        with self.subTest('numpy'):
+            self.assertEqual(pt1, Point.from_value(np.array([4, 7])))
         with self.subTest('invalid'):
             with self.assertRaises(ValueError):
                 Point.from_value('foo')
+        with self.subTest('invalid numpy'):
+            with self.assertRaises(ValueError):
+                Point.from_value(np.array([4, 7, 9]))
 
     def test_getitem(self):
         pt1 = Point(4, 7)
@@ -0,0 +1,120 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from backpack.config import serde
+from backpack.config.serde import IntegerListSerDe
+
+WELL_FORMED = [
+    '0',
+    '7',
+    ' +4 ',
+    '1,2,3',
+    '1, 2, -3',
+    '-1,-2,-3',
+    '9223372036854775807',              # int64 maximum
+    '99999999999999999999',             # exceeds the int64 range
+    '1,99999999999999999999,2',
+    ','.join(str(i) for i in range(1000)),
+]
+
+MALFORMED = [
+    '', ' ', '+', '-', ',',
+    '1, 2, ',                           # trailing separator
+    '1,,2', '1,a', '1.5', '1e3', '0x1f', '1 2', '+-1', '--5',
+]
+
+
+class IntegerListDeserializeTests:
+    ''' Deserialization test cases, run against the different parser paths by the
+    TestCase subclasses below. '''
+
+    def test_well_formed(self):
+        for value in WELL_FORMED:
+            with self.subTest(value=value):
+                expected = [int(e) for e in value.split(',')]
+                self.assertEqual(IntegerListSerDe.deserialize(value), expected,
+                                 'deserialize returned incorrect values')
+
+    def test_malformed_raises(self):
+        for value in MALFORMED:
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    IntegerListSerDe.deserialize(value)
+
+    def test_custom_separator(self):
+        self.assertEqual(IntegerListSerDe.deserialize('4;5', {'separator': ';'}), [4, 5])
+
+    def test_multichar_separator(self):
+        self.assertEqual(IntegerListSerDe.deserialize('4; 5', {'separator': '; '}), [4, 5])
+        with self.assertRaises(ValueError):
+            IntegerListSerDe.deserialize('4;5', {'separator': '; '})
+
+    def test_space_separator(self):
+        self.assertEqual(IntegerListSerDe.deserialize('1 2 3', {'separator': ' '}), [1, 2, 3])
+        with self.assertRaises(ValueError):
+            IntegerListSerDe.deserialize('1  2', {'separator': ' '})
+
+    def test_as_ndarray(self):
+        arr = IntegerListSerDe.deserialize('1, 2, -3', {'as_ndarray': True})
+        self.assertIsInstance(arr, np.ndarray)
+        self.assertEqual(arr.dtype, np.int64)
+        self.assertEqual(arr.tolist(), [1, 2, -3])
+
+    def test_as_ndarray_multichar_separator(self):
+        arr = IntegerListSerDe.deserialize('4;;5', {'separator': ';;', 'as_ndarray': True})
+        self.assertIsInstance(arr, np.ndarray)
+        self.assertEqual(arr.tolist(), [4, 5])
+
+
+@unittest.skipUnless(IntegerListSerDe.jit_enabled(), 'numba is not installed')
+class TestDeserializeNumbaPath(IntegerListDeserializeTests, unittest.TestCase):
+    ''' Exercises the numba JIT parser (with fall-back to the exact parser). '''
+
+
+class TestDeserializeNumpyPath(IntegerListDeserializeTests, unittest.TestCase):
+    ''' Exercises the numpy parser (with fall-back to the exact parser). '''
+
+    def setUp(self):
+        patcher = patch.object(serde, '_parse_int_list', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestDeserializePythonPath(IntegerListDeserializeTests, unittest.TestCase):
+    ''' Exercises the exact Python parser with both fast paths disabled. '''
+
+    def setUp(self):
+        for patcher in (
+            patch.object(serde, '_parse_int_list', None),
+            patch.object(IntegerListSerDe, '_parse_numpy', staticmethod(lambda value, sep: None)),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class TestIntegerListSerialize(unittest.TestCase):
+
+    def test_list(self):
+        self.assertEqual(IntegerListSerDe.serialize([1, 2, -3]), '1, 2, -3')
+
+    def test_ndarray(self):
+        self.assertEqual(IntegerListSerDe.serialize(np.array([1, 2, -3])), '1, 2, -3')
+
+    def test_custom_separator(self):
+        self.assertEqual(IntegerListSerDe.serialize([1, 2], {'separator': ';'}), '1;2')
+
+    def test_round_trip(self):
+        value = [1, 2, -3, 99999999999999999999]
+        serialized = IntegerListSerDe.serialize(value)
+        self.assertEqual(IntegerListSerDe.deserialize(serialized, {'separator': ', '}), value)
+
+
+class TestJitHelpers(unittest.TestCase):
+
+    def test_jit_enabled(self):
+        self.assertEqual(IntegerListSerDe.jit_enabled(), serde._parse_int_list is not None)
+
+    def test_warm_up(self):
+        IntegerListSerDe.warm_up()
@@ -127,6 +127,16 @@ class TestTicker(unittest.TestCase):
         self.assertEqual(self.ticker.freq(), expected_freq,
                         'ticker.mean() returned incorrect value')
 
+    def test_zero_max_intervals(self, backpack_mock_time):
+        self._setup_mocks(backpack_mock_time)
+        self.ticker = Ticker(max_intervals=0)
+        for _ in range(3):
+            self.ticker.tick()
+            time.sleep(1)
+        self.assertEqual(self.ticker.len(), 0, 'no intervals should be recorded')
+        self.assertEqual(self.ticker.min(), 0.0, 'ticker.min() returned incorrect value')
+        self.assertEqual(self.ticker.max(), 0.0, 'ticker.max() returned incorrect value')
+
     def test_no_tick_no_crash(self, backpack_mock_time):
         self._setup_mocks(backpack_mock_time)
         self.ticker = Ticker(max_intervals=MAX_INTERVALS_CNT)